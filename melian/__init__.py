@@ -1,5 +1,6 @@
 """Melian Python client library."""
 
-from .client import MelianClient
+from .aio import MelianAsyncClient
+from .client import Fetcher, LazyRow, MelianClient
 
-__all__ = ["MelianClient"]
+__all__ = ["Fetcher", "LazyRow", "MelianAsyncClient", "MelianClient"]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import _ClientBase, _loads
+
+class MelianAsyncClient(_ClientBase):
+    """Asyncio variant of :class:`melian.MelianClient`.
+
+    A single connection serializes its request/response exchanges behind
+    an asyncio.Lock, so one client can be shared by many coroutines; use
+    several clients to actually overlap fetches on independent
+    connections. The schema is fetched lazily on first use unless one of
+    schema/schema_spec/schema_file is supplied.
+    """
+
+    def __init__(
+        self,
+        dsn: str = "unix:///tmp/melian.sock",
+        *,
+        timeout: float = 1.0,
+        schema: Optional[Dict[str, Any]] = None,
+        schema_spec: Optional[str] = None,
+        schema_file: Optional[str] = None,
+    ) -> None:
+        self._dsn = self._parse_dsn(dsn)
+        if self._dsn.kind == "unix+seqpacket":
+            raise ValueError("unix+seqpacket DSNs are not supported by the async client")
+        self._timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._io_lock = asyncio.Lock()
+        self._schema = self._bootstrap_static(schema, schema_spec, schema_file)
+        if self._schema is not None:
+            self._schema = self._intern_schema(self._schema)
+            self._index_map = self._build_index_map(self._schema)
+        else:
+            self._index_map = {}
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._reader = None
+            self._writer = None
+
+    async def schema(self) -> Dict[str, Any]:
+        await self._ensure_schema()
+        return self._schema
+
+    async def describe_schema(self) -> Dict[str, Any]:
+        payload = await self._send(self.ACTION_DESCRIBE, 0, 0, b"")
+        if not payload:
+            raise RuntimeError("Melian server returned empty schema description")
+        decoded = _loads(payload)
+        if not isinstance(decoded, dict):
+            raise RuntimeError("Schema description must be a JSON object")
+        return decoded
+
+    async def fetch_raw(self, table_id: int, index_id: int, key: bytes) -> bytes:
+        if table_id < 0 or index_id < 0 or (table_id | index_id) > 255:
+            raise ValueError("table_id and index_id must be between 0 and 255")
+        return await self._send(self.ACTION_FETCH, table_id, index_id, key)
+
+    async def fetch_by_string(
+        self, table_id: int, index_id: int, key: bytes
+    ) -> Optional[Dict[str, Any]]:
+        payload = await self.fetch_raw(table_id, index_id, key)
+        if not payload:
+            return None
+        decoded = _loads(payload)
+        if not isinstance(decoded, dict):
+            raise RuntimeError("Expected JSON object from server")
+        return decoded
+
+    async def fetch_by_int(
+        self, table_id: int, index_id: int, record_id: int
+    ) -> Optional[Dict[str, Any]]:
+        key = self._INT_KEY.pack(record_id)
+        return await self.fetch_by_string(table_id, index_id, key)
+
+    async def fetch_by_string_from(
+        self, table_name: str, column_name: str, key: bytes | bytearray | memoryview | str
+    ) -> Optional[Dict[str, Any]]:
+        await self._ensure_schema()
+        table_id, index_id = self.resolve_index(table_name, column_name)
+        if isinstance(key, str):
+            key_bytes = key.encode("utf-8")
+        elif isinstance(key, memoryview):
+            key_bytes = key.tobytes()
+        else:
+            key_bytes = bytes(key)
+        return await self.fetch_by_string(table_id, index_id, key_bytes)
+
+    async def fetch_by_int_from(
+        self, table_name: str, column_name: str, record_id: int
+    ) -> Optional[Dict[str, Any]]:
+        await self._ensure_schema()
+        table_id, index_id = self.resolve_index(table_name, column_name)
+        return await self.fetch_by_int(table_id, index_id, record_id)
+
+    async def _ensure_schema(self) -> None:
+        if self._schema is None:
+            self._schema = self._intern_schema(await self.describe_schema())
+            self._index_map = self._build_index_map(self._schema)
+
+    async def _ensure_connected(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader is not None and self._writer is not None:
+            return self._reader, self._writer
+
+        if self._dsn.kind == "unix":
+            assert self._dsn.path
+            reader, writer = await asyncio.open_unix_connection(self._dsn.path)
+        else:
+            reader, writer = await asyncio.open_connection(
+                self._dsn.host, int(self._dsn.port)
+            )
+        self._reader = reader
+        self._writer = writer
+        return reader, writer
+
+    async def _send(
+        self, action: int, table_id: int, index_id: int, payload: bytes
+    ) -> bytes:
+        async with self._io_lock:
+            reader, writer = await self._ensure_connected()
+            header = self._HEADER.pack(
+                self.HEADER_VERSION,
+                action,
+                table_id,
+                index_id,
+                len(payload),
+            )
+            writer.write(header + payload)
+            try:
+                await asyncio.wait_for(writer.drain(), self._timeout)
+                length_bytes = await asyncio.wait_for(
+                    reader.readexactly(4), self._timeout
+                )
+                (length,) = self._LENGTH.unpack(length_bytes)
+                if length == 0:
+                    return b""
+                return await asyncio.wait_for(
+                    reader.readexactly(length), self._timeout
+                )
+            except asyncio.IncompleteReadError:
+                await self.close()
+                raise RuntimeError("Socket closed while reading response") from None
+            except (asyncio.TimeoutError, OSError):
+                await self.close()
+                raise
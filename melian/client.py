@@ -2,12 +2,48 @@ from __future__ import annotations
 
 import json
 import os
+import queue
+import re
 import socket
 import struct
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional transport codec
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional lazy parser
+    simdjson = None  # type: ignore[assignment]
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Schema-spec tokenizers, compiled once. Chunks and index specs are
+# pulled out with finditer instead of building intermediate split lists.
+_SPEC_CHUNK_RE = re.compile(r"[^,]+")
+_SPEC_TABLE_RE = re.compile(r"^([^|]*)\|([^|]*)(?:\|([^|]*))?(?:\|.*)?$")
+_SPEC_INDEX_RE = re.compile(r"[^;]+")
+
+# sendmsg is available on POSIX; without it (Windows) large payloads
+# fall back to being copied into the send buffer.
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# Idle connections shared by all clients pointing at the same DSN, so
+# thread pools reuse sockets instead of paying a connect() per worker.
+_POOL: Dict[str, "queue.LifoQueue[socket.socket]"] = {}
+_POOL_LOCK = threading.Lock()
+
 @dataclass(frozen=True)
 class Dsn:
     kind: str
@@ -15,12 +51,216 @@ class Dsn:
     port: Optional[int] = None
     path: Optional[str] = None
 
-class MelianClient:
-    """Thin client for the Melian cache server."""
+class LazyRow:
+    """Row wrapper that defers JSON decoding until a field is read.
+
+    Useful when rows carry many columns but the caller only touches a
+    few: with pysimdjson installed only the accessed fields are fully
+    materialized; otherwise the payload is decoded once on first access.
+    """
+
+    __slots__ = ("_raw", "_doc")
+
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+        self._doc: Any = None
+
+    def raw(self) -> bytes:
+        return self._raw
+
+    def as_dict(self) -> Dict[str, Any]:
+        doc = self._parse()
+        if hasattr(doc, "as_dict"):
+            return doc.as_dict()
+        return doc
+
+    def __getitem__(self, key: str) -> Any:
+        return self._parse()[key]
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self._parse()[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self._parse()[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Any:
+        return self._parse().keys()
+
+    def _parse(self) -> Any:
+        if self._doc is None:
+            if simdjson is not None:
+                # Each row gets its own parser: pysimdjson documents are
+                # invalidated when their parser re-parses.
+                self._doc = simdjson.Parser().parse(self._raw)
+            else:
+                self._doc = _loads(self._raw)
+        return self._doc
+
+class _ClientBase:
+    """Protocol constants and I/O-free schema handling shared by the
+    synchronous and asyncio clients."""
 
     HEADER_VERSION = 0x11
     ACTION_FETCH = 0x46  # 'F'
     ACTION_DESCRIBE = 0x44  # 'D'
+    ACTION_FETCH_MSGPACK = 0x4D  # 'M'
+    SOCKET_BUFFER_SIZE = 1 << 20
+
+    # Precompiled wire formats; skips the format-string cache probe that
+    # struct.pack/unpack pay on every call.
+    _HEADER = struct.Struct("!BBBBI")
+    _LENGTH = struct.Struct("!I")
+    _INT_KEY = struct.Struct("<I")
+
+    def schema(self) -> Dict[str, Any]:
+        return self._schema
+
+    def resolve_index(self, table_name: str, column: str) -> Tuple[int, int]:
+        try:
+            return self._index_map[(table_name, column)]
+        except KeyError:
+            raise RuntimeError(
+                f"Unable to resolve index for {table_name}.{column}"
+            ) from None
+
+    @staticmethod
+    def _intern_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+        # Table and column names recur in every resolve_index call;
+        # interning them shares one string object (and its cached hash)
+        # between the schema and the index map.
+        for table in schema.get("tables", []):
+            if isinstance(table.get("name"), str):
+                table["name"] = sys.intern(table["name"])
+            for index in table.get("indexes", []):
+                if isinstance(index.get("column"), str):
+                    index["column"] = sys.intern(index["column"])
+                if isinstance(index.get("type"), str):
+                    index["type"] = sys.intern(index["type"])
+        return schema
+
+    @staticmethod
+    def _build_index_map(
+        schema: Dict[str, Any]
+    ) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        return {
+            (table["name"], index["column"]): (int(table["id"]), int(index["id"]))
+            for table in schema.get("tables", [])
+            for index in table.get("indexes", [])
+        }
+
+    @classmethod
+    def _bootstrap_static(
+        cls,
+        schema: Optional[Dict[str, Any]],
+        schema_spec: Optional[str],
+        schema_file: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        provided = [bool(schema), bool(schema_spec), bool(schema_file)]
+        if sum(provided) > 1:
+            raise ValueError("Provide at most one of schema, schema_spec, schema_file")
+        if schema is not None:
+            return schema
+        if schema_spec is not None:
+            return cls._load_schema_from_spec(schema_spec)
+        if schema_file is not None:
+            return cls._load_schema_from_file(schema_file)
+        return None
+
+    @classmethod
+    def _load_schema_from_file(cls, path: str) -> Dict[str, Any]:
+        file_path = Path(path)
+        if not file_path.is_file():
+            raise FileNotFoundError(path)
+        contents = file_path.read_bytes()
+        data = _loads(contents)
+        if not isinstance(data, dict):
+            raise RuntimeError("Schema file must contain a JSON object")
+        return data
+
+    @classmethod
+    def _load_schema_from_spec(cls, spec: str) -> Dict[str, Any]:
+        spec = spec.strip()
+        if not spec:
+            raise ValueError("schema_spec cannot be empty")
+
+        tables: List[Dict[str, Any]] = []
+        for chunk_match in _SPEC_CHUNK_RE.finditer(spec):
+            chunk = chunk_match.group().strip()
+            if not chunk:
+                continue
+            table_match = _SPEC_TABLE_RE.match(chunk)
+            if table_match is None:
+                raise ValueError(f"Invalid table spec chunk: {chunk}")
+            table_part, period_part, columns_part = table_match.groups()
+            period = int(period_part) if period_part else 0
+            columns_part = columns_part or ""
+
+            table_name, table_id = cls._split_with_hash(table_part, "table")
+            table = {"name": table_name, "id": int(table_id), "period": period, "indexes": []}
+
+            if not columns_part:
+                raise ValueError(f"Table {table_name} must define at least one index")
+            for idx_match in _SPEC_INDEX_RE.finditer(columns_part):
+                idx_spec = idx_match.group().strip()
+                if not idx_spec:
+                    continue
+                column_with_id, has_type, index_type = idx_spec.partition(":")
+                column_name, column_id = cls._split_with_hash(column_with_id, "index")
+                if not has_type:
+                    index_type = "int"
+                table["indexes"].append(
+                    {"column": column_name, "id": int(column_id), "type": index_type}
+                )
+
+            tables.append(table)
+
+        if not tables:
+            raise ValueError("schema_spec produced no tables")
+        return {"tables": tables}
+
+    @staticmethod
+    def _split_with_hash(value: str, label: str) -> Tuple[str, str]:
+        if "#" not in value:
+            raise ValueError(f"Missing # delimiter for {label} specification: {value}")
+        name, ident = value.split("#", 1)
+        name = name.strip()
+        ident = ident.strip()
+        if not name or not ident:
+            raise ValueError(f"Invalid {label} specification: {value}")
+        return name, ident
+
+    @staticmethod
+    def _parse_dsn(dsn: str) -> Dsn:
+        if dsn.startswith("unix://"):
+            path = dsn[len("unix://") :]
+            if not path:
+                raise ValueError("unix DSN must include socket path")
+            return Dsn("unix", path=path)
+        if dsn.startswith("unix+seqpacket://"):
+            path = dsn[len("unix+seqpacket://") :]
+            if not path:
+                raise ValueError("unix DSN must include socket path")
+            return Dsn("unix+seqpacket", path=path)
+        if dsn.startswith("tcp://"):
+            host_port = dsn[len("tcp://") :]
+            host, _, port_str = host_port.rpartition(":")
+            if not host or not port_str:
+                raise ValueError("tcp DSN must include host:port")
+            return Dsn("tcp", host=host, port=int(port_str))
+        raise ValueError(f"Unsupported DSN: {dsn}")
+
+class MelianClient(_ClientBase):
+    """Thin client for the Melian cache server."""
+
+    POOL_MAX_IDLE = 8
+    SEQPACKET_BUFFER_SIZE = 1 << 16
 
     def __init__(
         self,
@@ -32,55 +272,186 @@ class MelianClient:
         schema_file: Optional[str] = None,
     ) -> None:
         self._dsn = self._parse_dsn(dsn)
+        self._seqpacket = self._dsn.kind == "unix+seqpacket"
         self._timeout = timeout
-        self._socket: Optional[socket.socket] = None
-        self._schema = self._bootstrap_schema(schema, schema_spec, schema_file)
+        self._pool = self._pool_for(dsn)
+        self._local = threading.local()
+        self._schema = self._bootstrap_static(schema, schema_spec, schema_file)
+        if self._schema is not None:
+            self._schema = self._intern_schema(self._schema)
+            self._index_map = self._build_index_map(self._schema)
+        else:
+            # No schema supplied: defer the DESCRIBE round trip until
+            # something actually needs the schema, so constructing a
+            # client (e.g. for fetch_raw with known ids) costs nothing.
+            self._index_map = {}
 
     def close(self) -> None:
-        if self._socket is not None:
-            self._socket.close()
-            self._socket = None
+        while True:
+            try:
+                sock = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            sock.close()
 
     def schema(self) -> Dict[str, Any]:
+        if self._schema is None:
+            self._schema = self._intern_schema(self.describe_schema())
+            self._index_map = self._build_index_map(self._schema)
         return self._schema
 
+    def resolve_index(self, table_name: str, column: str) -> Tuple[int, int]:
+        if self._schema is None:
+            self.schema()
+        return super().resolve_index(table_name, column)
+
     def describe_schema(self) -> Dict[str, Any]:
         payload = self._send(self.ACTION_DESCRIBE, 0, 0, b"")
         if not payload:
             raise RuntimeError("Melian server returned empty schema description")
-        decoded = json.loads(payload)
+        decoded = _loads(payload)
         if not isinstance(decoded, dict):
             raise RuntimeError("Schema description must be a JSON object")
         return decoded
 
-    def fetch_raw(self, table_id: int, index_id: int, key: bytes) -> bytes:
-        if not (0 <= table_id <= 255 and 0 <= index_id <= 255):
+    def fetch_raw(
+        self, table_id: int, index_id: int, key: bytes | bytearray | memoryview
+    ) -> bytes:
+        if table_id < 0 or index_id < 0 or (table_id | index_id) > 255:
             raise ValueError("table_id and index_id must be between 0 and 255")
-        return self._send(self.ACTION_FETCH, table_id, index_id, key)
+        return self._send_fetch(table_id, index_id, key)
 
-    def fetch_by_string(self, table_id: int, index_id: int, key: bytes) -> Optional[Dict[str, Any]]:
+    def fetch_by_string(
+        self, table_id: int, index_id: int, key: bytes | bytearray | memoryview
+    ) -> Optional[Dict[str, Any]]:
         payload = self.fetch_raw(table_id, index_id, key)
         if not payload:
             return None
-        decoded = json.loads(payload)
+        decoded = _loads(payload)
         if not isinstance(decoded, dict):
             raise RuntimeError("Expected JSON object from server")
         return decoded
 
     def fetch_by_int(self, table_id: int, index_id: int, record_id: int) -> Optional[Dict[str, Any]]:
-        key = struct.pack("<I", record_id)
+        key = self._INT_KEY.pack(record_id)
         return self.fetch_by_string(table_id, index_id, key)
 
+    def fetch_lazy(
+        self, table_id: int, index_id: int, key: bytes | bytearray | memoryview
+    ) -> Optional[LazyRow]:
+        """Like fetch_by_string, but defers JSON decoding to field access."""
+        payload = self.fetch_raw(table_id, index_id, key)
+        if not payload:
+            return None
+        return LazyRow(payload)
+
+    def fetch_by_string_msgpack(
+        self, table_id: int, index_id: int, key: bytes
+    ) -> Optional[Dict[str, Any]]:
+        """Like fetch_by_string, but asks the server for MessagePack.
+
+        MessagePack responses are smaller on the wire and cheaper to
+        decode than JSON for large rows. Requires the msgpack package
+        and a server that understands the ACTION_FETCH_MSGPACK action.
+        """
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        if table_id < 0 or index_id < 0 or (table_id | index_id) > 255:
+            raise ValueError("table_id and index_id must be between 0 and 255")
+        payload = self._send(self.ACTION_FETCH_MSGPACK, table_id, index_id, key)
+        if not payload:
+            return None
+        decoded = msgpack.unpackb(payload, raw=False)
+        if not isinstance(decoded, dict):
+            raise RuntimeError("Expected MessagePack map from server")
+        return decoded
+
+    def fetch_by_int_msgpack(
+        self, table_id: int, index_id: int, record_id: int
+    ) -> Optional[Dict[str, Any]]:
+        key = self._INT_KEY.pack(record_id)
+        return self.fetch_by_string_msgpack(table_id, index_id, key)
+
+    def batch_fetch(
+        self, requests: List[Tuple[int, int, bytes]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Pipeline several fetches over one round trip.
+
+        All requests are written before any response is read, so the
+        total wall-clock cost is roughly one round trip instead of one
+        per request. On stream DSNs the frames go out in a single
+        sendall; on seqpacket DSNs each frame is sent as its own message
+        to preserve the one-message-per-request boundary.
+        """
+        if not requests:
+            return []
+        for table_id, index_id, _ in requests:
+            if table_id < 0 or index_id < 0 or (table_id | index_id) > 255:
+                raise ValueError("table_id and index_id must be between 0 and 255")
+
+        buf = bytearray(sum(8 + len(key) for _, _, key in requests))
+        offset = 0
+        for table_id, index_id, key in requests:
+            self._HEADER.pack_into(
+                buf,
+                offset,
+                self.HEADER_VERSION,
+                self.ACTION_FETCH,
+                table_id,
+                index_id,
+                len(key),
+            )
+            offset += 8
+            buf[offset : offset + len(key)] = key
+            offset += len(key)
+        sock = self._acquire()
+        results: List[Optional[Dict[str, Any]]] = []
+        try:
+            if self._seqpacket:
+                view = memoryview(buf)
+                offset = 0
+                for _, _, key in requests:
+                    frame_end = offset + 8 + len(key)
+                    sock.sendall(view[offset:frame_end])
+                    offset = frame_end
+            else:
+                sock.sendall(buf)
+            for _ in requests:
+                payload = self._recv_payload(sock)
+                if not payload:
+                    results.append(None)
+                    continue
+                decoded = _loads(payload)
+                if not isinstance(decoded, dict):
+                    raise RuntimeError("Expected JSON object from server")
+                results.append(decoded)
+        except Exception:
+            sock.close()
+            raise
+        self._release(sock)
+        return results
+
     def fetch_by_string_from(
         self, table_name: str, column_name: str, key: bytes | bytearray | memoryview | str
     ) -> Optional[Dict[str, Any]]:
         table_id, index_id = self.resolve_index(table_name, column_name)
         if isinstance(key, str):
-            key_bytes = key.encode("utf-8")
-        elif isinstance(key, memoryview):
-            key_bytes = key.tobytes()
+            key_bytes: bytes | memoryview = key.encode("utf-8")
+        elif isinstance(key, (bytearray, memoryview)):
+            # The send path copies into its own buffer via slice
+            # assignment, which accepts any bytes-like object, so byte
+            # views pass through without a defensive copy. Views with
+            # wider items (e.g. over array("I")) must be normalized to
+            # bytes, or len() would count elements instead of bytes.
+            mv = memoryview(key)
+            if not mv.contiguous:
+                key_bytes = mv.tobytes()
+            elif mv.itemsize != 1:
+                key_bytes = mv.cast("B")
+            else:
+                key_bytes = mv
         else:
-            key_bytes = bytes(key)
+            key_bytes = key
         return self.fetch_by_string(table_id, index_id, key_bytes)
 
     def fetch_by_int_from(
@@ -89,143 +460,254 @@ class MelianClient:
         table_id, index_id = self.resolve_index(table_name, column_name)
         return self.fetch_by_int(table_id, index_id, record_id)
 
-    def resolve_index(self, table_name: str, column: str) -> Tuple[int, int]:
-        for table in self._schema.get("tables", []):
-            if table.get("name") != table_name:
-                continue
-            for index in table.get("indexes", []):
-                if index.get("column") == column:
-                    return int(table["id"]), int(index["id"])
-        raise RuntimeError(f"Unable to resolve index for {table_name}.{column}")
+    def fetcher(self, table_name: str, column_name: str) -> "Fetcher":
+        """Return a fetch handle bound to one (table, column) pair.
+
+        The handle resolves the identifiers once and keeps a request
+        buffer with the full 4-byte header prefix prepacked, so repeated
+        fetches against the same index skip both the name resolution and
+        most of the header construction.
+        """
+        table_id, index_id = self.resolve_index(table_name, column_name)
+        return Fetcher(self, table_id, index_id)
 
-    def _ensure_connected(self) -> socket.socket:
-        if self._socket is not None:
-            return self._socket
+    @classmethod
+    def _pool_for(cls, dsn: str) -> "queue.LifoQueue[socket.socket]":
+        with _POOL_LOCK:
+            pool = _POOL.get(dsn)
+            if pool is None:
+                pool = _POOL[dsn] = queue.LifoQueue(maxsize=cls.POOL_MAX_IDLE)
+            return pool
+
+    def _acquire(self) -> socket.socket:
+        try:
+            sock = self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+        # The pool is keyed by DSN only, so a checked-out socket may carry
+        # another client's timeout; restore this client's.
+        sock.settimeout(self._timeout)
+        return sock
 
-        if self._dsn.kind == "unix":
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    def _release(self, sock: socket.socket) -> None:
+        try:
+            self._pool.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+
+    def _connect(self) -> socket.socket:
+        if self._dsn.kind in ("unix", "unix+seqpacket"):
+            sock_type = (
+                socket.SOCK_SEQPACKET
+                if self._dsn.kind == "unix+seqpacket"
+                else socket.SOCK_STREAM
+            )
+            sock = socket.socket(socket.AF_UNIX, sock_type)
             assert self._dsn.path
             sock.connect(self._dsn.path)
         else:
             sock = socket.create_connection((self._dsn.host, int(self._dsn.port)))
+            # Requests are tiny; Nagle's algorithm only adds latency here.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
         sock.settimeout(self._timeout)
-        self._socket = sock
         return sock
 
+    def _buffers(self) -> threading.local:
+        # Per-thread send buffers, so pooled connections can be used from
+        # thread pools without frames trampling each other.
+        local = self._local
+        if not hasattr(local, "send_buf"):
+            local.send_buf = bytearray(4096)
+            local.fetch_buf = self._new_fetch_buf(4096)
+        return local
+
     def _send(self, action: int, table_id: int, index_id: int, payload: bytes) -> bytes:
-        sock = self._ensure_connected()
-        header = struct.pack(
-            "!BBBBI",
+        local = self._buffers()
+        total = 8 + len(payload)
+        if total > len(local.send_buf):
+            if _HAS_SENDMSG:
+                header = self._HEADER.pack(
+                    self.HEADER_VERSION, action, table_id, index_id, len(payload)
+                )
+                return self._roundtrip_gather(header, payload)
+            local.send_buf = bytearray(total)
+        buf = local.send_buf
+        self._HEADER.pack_into(
+            buf,
+            0,
             self.HEADER_VERSION,
             action,
             table_id,
             index_id,
             len(payload),
         )
-        sock.sendall(header + payload)
+        buf[8:total] = payload
+        return self._roundtrip(memoryview(buf)[:total])
+
+    def _send_fetch(
+        self, table_id: int, index_id: int, payload: bytes | bytearray | memoryview
+    ) -> bytes:
+        # Specialized for the hot FETCH path: the version and action bytes
+        # are baked into the buffer, so only table_id, index_id, and the
+        # payload length need patching per call.
+        local = self._buffers()
+        total = 8 + len(payload)
+        if total > len(local.fetch_buf):
+            if _HAS_SENDMSG:
+                header = self._HEADER.pack(
+                    self.HEADER_VERSION,
+                    self.ACTION_FETCH,
+                    table_id,
+                    index_id,
+                    len(payload),
+                )
+                return self._roundtrip_gather(header, payload)
+            local.fetch_buf = self._new_fetch_buf(total)
+        buf = local.fetch_buf
+        buf[2] = table_id
+        buf[3] = index_id
+        self._LENGTH.pack_into(buf, 4, len(payload))
+        buf[8:total] = payload
+        return self._roundtrip(memoryview(buf)[:total])
+
+    def _roundtrip(self, frame: "bytes | bytearray | memoryview") -> bytes:
+        sock = self._acquire()
+        try:
+            sock.sendall(frame)
+            payload = self._recv_payload(sock)
+        except Exception:
+            # Broken or desynced connection; never return it to the pool.
+            sock.close()
+            raise
+        self._release(sock)
+        return payload
+
+    def _roundtrip_gather(self, header: bytes, payload: bytes | bytearray | memoryview) -> bytes:
+        # Large payloads are handed to the kernel as two iovecs instead of
+        # being copied into the send buffer first.
+        sock = self._acquire()
+        try:
+            sent = sock.sendmsg((header, payload))
+            total = len(header) + len(payload)
+            while sent < total:
+                if sent < len(header):
+                    sent += sock.sendmsg(
+                        (memoryview(header)[sent:], payload)
+                    )
+                else:
+                    sock.sendall(memoryview(payload)[sent - len(header) :])
+                    sent = total
+            result = self._recv_payload(sock)
+        except Exception:
+            sock.close()
+            raise
+        self._release(sock)
+        return result
+
+    def _recv_payload(self, sock: socket.socket) -> bytes:
+        if self._seqpacket:
+            return self._recv_packet(sock)
         length_bytes = self._read_exact(sock, 4)
-        (length,) = struct.unpack("!I", length_bytes)
+        (length,) = self._LENGTH.unpack(length_bytes)
         if length == 0:
             return b""
         return self._read_exact(sock, length)
 
+    def _recv_packet(self, sock: socket.socket) -> bytes:
+        # SOCK_SEQPACKET preserves message boundaries, so the whole framed
+        # response arrives in a single recv instead of the length/body
+        # pair of reads the stream path needs.
+        buf = bytearray(self.SEQPACKET_BUFFER_SIZE)
+        received = sock.recv_into(buf)
+        if received < 4:
+            raise RuntimeError("Socket closed while reading response")
+        (length,) = self._LENGTH.unpack_from(buf)
+        if length == 0:
+            return b""
+        if 4 + length > received:
+            raise RuntimeError(
+                f"Seqpacket response of {length} bytes exceeds the "
+                f"{self.SEQPACKET_BUFFER_SIZE}-byte receive buffer"
+            )
+        return bytes(memoryview(buf)[4 : 4 + length])
+
+    @classmethod
+    def _new_fetch_buf(cls, size: int) -> bytearray:
+        buf = bytearray(size)
+        buf[0] = cls.HEADER_VERSION
+        buf[1] = cls.ACTION_FETCH
+        return buf
+
     def _read_exact(self, sock: socket.socket, size: int) -> bytes:
-        chunks: List[bytes] = []
-        remaining = size
-        while remaining:
-            chunk = sock.recv(remaining)
-            if not chunk:
+        buf = bytearray(size)
+        view = memoryview(buf)
+        offset = 0
+        # On blocking sockets MSG_WAITALL asks the kernel to fill the
+        # whole buffer in one recv. Sockets with a timeout are internally
+        # non-blocking, where the flag is a no-op at best, so only the
+        # loop below applies there.
+        flags = socket.MSG_WAITALL if self._timeout is None else 0
+        while offset < size:
+            received = sock.recv_into(view[offset:], 0, flags)
+            if not received:
                 raise RuntimeError("Socket closed while reading response")
-            chunks.append(chunk)
-            remaining -= len(chunk)
-        return b"".join(chunks)
-
-    def _bootstrap_schema(
-        self,
-        schema: Optional[Dict[str, Any]],
-        schema_spec: Optional[str],
-        schema_file: Optional[str],
-    ) -> Dict[str, Any]:
-        provided = [bool(schema), bool(schema_spec), bool(schema_file)]
-        if sum(provided) > 1:
-            raise ValueError("Provide at most one of schema, schema_spec, schema_file")
-        if schema is not None:
-            return schema
-        if schema_spec is not None:
-            return self._load_schema_from_spec(schema_spec)
-        if schema_file is not None:
-            return self._load_schema_from_file(schema_file)
-        return self.describe_schema()
+            offset += received
+        return bytes(buf)
 
-    def _load_schema_from_file(self, path: str) -> Dict[str, Any]:
-        file_path = Path(path)
-        if not file_path.is_file():
-            raise FileNotFoundError(path)
-        contents = file_path.read_text(encoding="utf-8")
-        data = json.loads(contents)
-        if not isinstance(data, dict):
-            raise RuntimeError("Schema file must contain a JSON object")
-        return data
+class Fetcher:
+    """Fetch handle bound to one (table_id, index_id) pair.
 
-    def _load_schema_from_spec(self, spec: str) -> Dict[str, Any]:
-        spec = spec.strip()
-        if not spec:
-            raise ValueError("schema_spec cannot be empty")
+    Produced by :meth:`MelianClient.fetcher`. The whole 4-byte header
+    prefix is packed once at construction and only the payload length is
+    patched per call. Not thread-safe: the handle owns its request
+    buffer, so use one Fetcher per thread.
+    """
 
-        tables: List[Dict[str, Any]] = []
-        for chunk in spec.split(","):
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-            parts = chunk.split("|")
-            if len(parts) < 2:
-                raise ValueError(f"Invalid table spec chunk: {chunk}")
-            table_part = parts[0]
-            period = int(parts[1]) if len(parts) >= 2 and parts[1] else 0
-            columns_part = parts[2] if len(parts) >= 3 else ""
+    __slots__ = ("_client", "table_id", "index_id", "_buf")
 
-            table_name, table_id = self._split_with_hash(table_part, "table")
-            table = {"name": table_name, "id": int(table_id), "period": period, "indexes": []}
+    def __init__(self, client: MelianClient, table_id: int, index_id: int) -> None:
+        if table_id < 0 or index_id < 0 or (table_id | index_id) > 255:
+            raise ValueError("table_id and index_id must be between 0 and 255")
+        self._client = client
+        self.table_id = table_id
+        self.index_id = index_id
+        self._buf = self._new_buf(4096)
 
-            if not columns_part:
-                raise ValueError(f"Table {table_name} must define at least one index")
-            for idx_spec in columns_part.split(";"):
-                idx_spec = idx_spec.strip()
-                if not idx_spec:
-                    continue
-                column_with_id, *type_part = idx_spec.split(":", 1)
-                column_name, column_id = self._split_with_hash(column_with_id, "index")
-                index_type = type_part[0] if type_part else "int"
-                table["indexes"].append(
-                    {"column": column_name, "id": int(column_id), "type": index_type}
+    def raw(self, key: bytes | bytearray | memoryview) -> bytes:
+        total = 8 + len(key)
+        buf = self._buf
+        if total > len(buf):
+            if _HAS_SENDMSG:
+                client = self._client
+                header = client._HEADER.pack(
+                    client.HEADER_VERSION,
+                    client.ACTION_FETCH,
+                    self.table_id,
+                    self.index_id,
+                    len(key),
                 )
+                return client._roundtrip_gather(header, key)
+            buf = self._buf = self._new_buf(total)
+        self._client._LENGTH.pack_into(buf, 4, len(key))
+        buf[8:total] = key
+        return self._client._roundtrip(memoryview(buf)[:total])
 
-            tables.append(table)
-
-        if not tables:
-            raise ValueError("schema_spec produced no tables")
-        return {"tables": tables}
+    def by_string(self, key: bytes | bytearray | memoryview) -> Optional[Dict[str, Any]]:
+        payload = self.raw(key)
+        if not payload:
+            return None
+        decoded = _loads(payload)
+        if not isinstance(decoded, dict):
+            raise RuntimeError("Expected JSON object from server")
+        return decoded
 
-    def _split_with_hash(self, value: str, label: str) -> Tuple[str, str]:
-        if "#" not in value:
-            raise ValueError(f"Missing # delimiter for {label} specification: {value}")
-        name, ident = value.split("#", 1)
-        name = name.strip()
-        ident = ident.strip()
-        if not name or not ident:
-            raise ValueError(f"Invalid {label} specification: {value}")
-        return name, ident
+    def by_int(self, record_id: int) -> Optional[Dict[str, Any]]:
+        return self.by_string(self._client._INT_KEY.pack(record_id))
 
-    def _parse_dsn(self, dsn: str) -> Dsn:
-        if dsn.startswith("unix://"):
-            path = dsn[len("unix://") :]
-            if not path:
-                raise ValueError("unix DSN must include socket path")
-            return Dsn("unix", path=path)
-        if dsn.startswith("tcp://"):
-            host_port = dsn[len("tcp://") :]
-            host, _, port_str = host_port.rpartition(":")
-            if not host or not port_str:
-                raise ValueError("tcp DSN must include host:port")
-            return Dsn("tcp", host=host, port=int(port_str))
-        raise ValueError(f"Unsupported DSN: {dsn}")
+    def _new_buf(self, size: int) -> bytearray:
+        buf = self._client._new_fetch_buf(size)
+        buf[2] = self.table_id
+        buf[3] = self.index_id
+        return buf
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import struct
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -12,7 +14,7 @@ if str(ROOT) not in sys.path:
 
 import pytest
 
-from melian import MelianClient
+from melian import LazyRow, MelianAsyncClient, MelianClient
 
 DEFAULT_DSN = "unix:///tmp/melian.sock"
 SCHEMA_SPEC = "table1#0|60|id#0:int,table2#1|60|id#0:int;hostname#1:string"
@@ -57,6 +59,27 @@ def test_table2_fetch_by_id_and_hostname(client: MelianClient) -> None:
     by_host = client.fetch_by_string(table_id, host_index, b"host-00002")
     assert by_host == expected
 
+def test_batch_fetch_preserves_order(client: MelianClient) -> None:
+    table_id, index_id = resolve_index(client, "table1", "id")
+    requests = [(table_id, index_id, struct.pack("<I", record_id)) for record_id in (5, 2, 5)]
+    results = client.batch_fetch(requests)
+    assert [row["id"] for row in results] == [5, 2, 5]
+    assert results[0] == client.fetch_by_int(table_id, index_id, 5)
+
+def test_batch_fetch_returns_none_for_misses(client: MelianClient) -> None:
+    table_id, index_id = resolve_index(client, "table1", "id")
+    requests = [
+        (table_id, index_id, struct.pack("<I", 5)),
+        (table_id, index_id, struct.pack("<I", 0xFFFFFFFF)),
+        (table_id, index_id, struct.pack("<I", 2)),
+    ]
+    results = client.batch_fetch(requests)
+    assert results[0] is not None and results[2] is not None
+    assert results[1] is None
+
+def test_batch_fetch_empty_request_list(client: MelianClient) -> None:
+    assert client.batch_fetch([]) == []
+
 def test_named_fetch_helpers(client: MelianClient) -> None:
     direct = client.fetch_by_int_from("table1", "id", 5)
     assert direct is not None
@@ -66,6 +89,56 @@ def test_named_fetch_helpers(client: MelianClient) -> None:
     assert named is not None
     assert named["id"] == 2
 
+def test_fetch_lazy_matches_eager_fetch(client: MelianClient) -> None:
+    table_id, index_id = resolve_index(client, "table1", "id")
+    row = client.fetch_lazy(table_id, index_id, struct.pack("<I", 5))
+    assert row is not None
+    assert row["name"] == "item_5"
+    assert row.get("category") == "alpha"
+    assert row.get("nonexistent", "fallback") == "fallback"
+    assert "value" in row and "nonexistent" not in row
+    assert row.as_dict() == client.fetch_by_int(table_id, index_id, 5)
+
+def test_fetch_lazy_returns_none_for_miss(client: MelianClient) -> None:
+    table_id, index_id = resolve_index(client, "table1", "id")
+    assert client.fetch_lazy(table_id, index_id, struct.pack("<I", 0xFFFFFFFF)) is None
+
+def test_lazy_row_dict_surface() -> None:
+    raw = b'{"id": 1, "name": "item_1"}'
+    row = LazyRow(raw)
+    assert row.raw() == raw
+    assert row["id"] == 1
+    assert sorted(row.keys()) == ["id", "name"]
+    assert row.as_dict() == {"id": 1, "name": "item_1"}
+
+def test_async_client_matches_sync(client: MelianClient) -> None:
+    async def run() -> Tuple[Any, Any, Any]:
+        aclient = MelianAsyncClient(dsn=os.getenv("MELIAN_TEST_DSN", DEFAULT_DSN))
+        try:
+            schema = await aclient.schema()
+            by_id, by_host = await asyncio.gather(
+                aclient.fetch_by_int_from("table1", "id", 5),
+                aclient.fetch_by_string_from("table2", "hostname", "host-00002"),
+            )
+        finally:
+            await aclient.close()
+        return schema, by_id, by_host
+
+    schema, by_id, by_host = asyncio.run(run())
+    assert normalize_schema(schema) == normalize_schema(client.schema())
+    assert by_id == client.fetch_by_int_from("table1", "id", 5)
+    assert by_host == client.fetch_by_string_from("table2", "hostname", "host-00002")
+
+def test_async_client_returns_none_for_miss() -> None:
+    async def run() -> Any:
+        aclient = MelianAsyncClient(dsn=os.getenv("MELIAN_TEST_DSN", DEFAULT_DSN))
+        try:
+            return await aclient.fetch_by_int_from("table1", "id", 0xFFFFFFFF)
+        finally:
+            await aclient.close()
+
+    assert asyncio.run(run()) is None
+
 def test_schema_spec_matches_live_description() -> None:
     live = MelianClient(dsn=os.getenv("MELIAN_TEST_DSN", DEFAULT_DSN)).schema()
     from_spec = MelianClient(
@@ -75,10 +148,46 @@ def test_schema_spec_matches_live_description() -> None:
 
     assert normalize_schema(live) == normalize_schema(from_spec)
 
+def test_fetcher_matches_named_helpers(client: MelianClient) -> None:
+    by_id = client.fetcher("table1", "id")
+    assert by_id.by_int(5) == client.fetch_by_int_from("table1", "id", 5)
+    assert by_id.by_int(0xFFFFFFFF) is None
+
+    by_host = client.fetcher("table2", "hostname")
+    assert by_host.by_string(b"host-00002") == client.fetch_by_string_from(
+        "table2", "hostname", b"host-00002"
+    )
+
+def test_fetcher_unknown_index_raises(client: MelianClient) -> None:
+    with pytest.raises(RuntimeError):
+        client.fetcher("table1", "nonexistent")
+
 def test_resolve_invalid_index_raises(client: MelianClient) -> None:
     with pytest.raises(RuntimeError):
         client.resolve_index("table1", "nonexistent")
 
+def test_fetch_raw_rejects_out_of_range_ids() -> None:
+    # Validation happens before any socket use, so no server is needed.
+    client = MelianClient(dsn=DEFAULT_DSN, schema_spec=SCHEMA_SPEC)
+    for table_id, index_id in ((-1, 0), (0, -1), (256, 0), (0, 256), (300, 300)):
+        with pytest.raises(ValueError):
+            client.fetch_raw(table_id, index_id, b"key")
+        with pytest.raises(ValueError):
+            client.batch_fetch([(table_id, index_id, b"key")])
+    client.close()
+
+def test_seqpacket_dsn_accepted_and_validated() -> None:
+    # Construction never touches the socket when a spec is supplied, so
+    # these run without a seqpacket-capable server.
+    client = MelianClient(dsn="unix+seqpacket:///tmp/melian.sock", schema_spec=SCHEMA_SPEC)
+    assert client.resolve_index("table1", "id") == (0, 0)
+    client.close()
+
+    with pytest.raises(ValueError):
+        MelianClient(dsn="unix+seqpacket://", schema_spec=SCHEMA_SPEC)
+    with pytest.raises(ValueError):
+        MelianAsyncClient(dsn="unix+seqpacket:///tmp/melian.sock")
+
 def resolve_index(client: MelianClient, table: str, column: str) -> Tuple[int, int]:
     resolved = client.resolve_index(table, column)
     return resolved[0], resolved[1]